@@ -516,7 +516,7 @@ def test_qscout_compile_wrong_base_entangling_gate() -> None:
         _ = service.qscout_compile(circuit, base_entangling_gate="yy")
 
 
-@mock.patch("requests.post")
+@mock.patch("requests.Session.post")
 def test_service_cq_compile_single(mock_post: mock.MagicMock) -> None:
 
     q0 = cirq.LineQubit(0)
@@ -534,7 +534,7 @@ def test_service_cq_compile_single(mock_post: mock.MagicMock) -> None:
     assert out.final_logical_to_physical == final_logical_to_physical
 
 
-@mock.patch("requests.post")
+@mock.patch("requests.Session.post")
 def test_service_ibmq_compile(mock_post: mock.MagicMock) -> None:
     service = css.Service(api_key="key", remote_host="http://example.com")
 
@@ -577,7 +577,7 @@ def test_service_supercheq(mock_supercheq: mock.MagicMock) -> None:
     assert service.supercheq([[0]], 1, 1) == (circuits, fidelities)
 
 
-@mock.patch("requests.post")
+@mock.patch("requests.Session.post")
 def test_service_target_info(mock_post: mock.MagicMock) -> None:
     fake_data = {"target_info": {"backend_name": "test_fake_device", "max_experiments": 1234}}
     mock_post.return_value.json = lambda: fake_data
@@ -16,12 +16,14 @@ import os
 import pathlib
 import sys
 import textwrap
+import threading
 import time
 import urllib
-from typing import Any, Callable, Dict, List, Optional, Union
+from typing import Any, Callable, Dict, Iterator, List, Optional, Union
 
 import qubovert as qv
 import requests
+import requests.adapters
 
 import general_superstaq as gss
 
@@ -39,6 +41,8 @@ class _SuperstaQClient:
     SUPPORTED_VERSIONS = {
         gss.API_VERSION,
     }
+    # maximum number of connections to keep open (and reuse) per host
+    MAX_POOL_SIZE = 32
 
     def __init__(
         self,
@@ -48,6 +52,7 @@ class _SuperstaQClient:
         api_version: str = gss.API_VERSION,
         max_retry_seconds: float = 60,  # 1 minute
         verbose: bool = False,
+        supports_streaming: bool = False,
     ):
         """Creates the SuperstaQClient.
 
@@ -65,6 +70,8 @@ class _SuperstaQClient:
                 which is the most recent version when this client was downloaded.
             max_retry_seconds: The time to continue retriable responses. Defaults to 3600.
             verbose: Whether to print to stderr and stdio any retriable errors that are encountered.
+            supports_streaming: Whether the server can push job updates over `stream_job` (so that
+                jobs don't need to be polled with `get_job`).
         """
 
         self.api_key = api_key or gss.superstaq_client.find_api_key()
@@ -73,6 +80,7 @@ class _SuperstaQClient:
         self.api_version = api_version
         self.max_retry_seconds = max_retry_seconds
         self.verbose = verbose
+        self.supports_streaming = supports_streaming
         url = urllib.parse.urlparse(self.remote_host)
         assert url.scheme and url.netloc, (
             f"Specified remote_host {self.remote_host} is not a valid url, for example "
@@ -92,6 +100,23 @@ class _SuperstaQClient:
             "X-Client-Name": self.client_name,
             "X-Client-Version": self.api_version,
         }
+        self._thread_local = threading.local()
+
+    @property
+    def session(self) -> requests.Session:
+        """The `requests.Session` used to make requests from the current thread.
+
+        Sessions reuse connections (and TLS sessions) across requests. `requests.Session` isn't
+        documented to be thread-safe, so each thread gets its own session (created on first use).
+        """
+        session = getattr(self._thread_local, "session", None)
+        if session is None:
+            session = requests.Session()
+            adapter = requests.adapters.HTTPAdapter(pool_maxsize=self.MAX_POOL_SIZE)
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+            self._thread_local.session = session
+        return session
 
     def get_request(self, endpoint: str) -> Any:
         """Performs a GET request on a given endpoint
@@ -102,7 +127,7 @@ class _SuperstaQClient:
         """
 
         def request() -> requests.Response:
-            return requests.get(
+            return self.session.get(
                 f"{self.url}{endpoint}",
                 headers=self.headers,
                 verify=self.verify_https,
@@ -117,7 +142,7 @@ class _SuperstaQClient:
             A dict containing the current SuperstaQ version.
         """
 
-        response = requests.get(self.url)
+        response = self.session.get(self.url)
         version = response.headers.get("superstaq_version")
 
         return {"superstaq_version": version}
@@ -132,7 +157,7 @@ class _SuperstaQClient:
         """
 
         def request() -> requests.Response:
-            return requests.post(
+            return self.session.post(
                 f"{self.url}{endpoint}",
                 json=json_dict,
                 headers=self.headers,
@@ -198,6 +223,52 @@ class _SuperstaQClient:
         """
         return self.get_request(f"/job/{job_id}")
 
+    def stream_job(self, job_id: str, timeout: Optional[float] = None) -> Iterator[Dict[str, Any]]:
+        """Streams updates of a job from the SuperstaQ API.
+
+        This holds a single connection open to the `/job/<job_id>/stream` endpoint, over which the
+        server pushes the job (as a server-sent event) whenever its status changes. Only available
+        if `supports_streaming` is set.
+
+        Args:
+            job_id: The UUID of the job (returned when the job was created).
+            timeout: The maximum number of seconds to stream for. This is also used as the timeout
+                for connecting and for each read, and is checked after every line received from
+                the server (including keep-alives, which would otherwise reset the read timeout).
+
+        Yields:
+            The json body of each update as a dict. Unlike other requests, opening the stream is not
+            retried: if it can't be opened (e.g. because the server doesn't support streaming), or
+            if the connection is dropped or times out, the stream just ends without an exception.
+            Callers can then fall back to `get_job`.
+        """
+        deadline = None if timeout is None else time.time() + timeout
+
+        try:
+            response = self.session.get(
+                f"{self.url}/job/{job_id}/stream",
+                headers=self.headers,
+                verify=self.verify_https,
+                stream=True,
+                timeout=timeout,
+            )
+        except requests.RequestException:
+            return
+
+        try:
+            if not response.ok:
+                return
+
+            for line in response.iter_lines():
+                if line.startswith(b"data:"):
+                    yield json.loads(line[len(b"data:") :])
+                if deadline is not None and time.time() >= deadline:
+                    return
+        except requests.RequestException:
+            return
+        finally:
+            response.close()
+
     def get_balance(self) -> Dict[str, float]:
         """Get the querying user's account balance in USD.
 
@@ -463,6 +534,16 @@ class _SuperstaQClient:
             time.sleep(delay_seconds)
             delay_seconds *= 2
 
+    def __getstate__(self) -> Dict[str, Any]:
+        # sessions can't be pickled (and are per-thread anyway), so copies create their own
+        state = self.__dict__.copy()
+        del state["_thread_local"]
+        return state
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        self._thread_local = threading.local()
+
     def __str__(self) -> str:
         return f"Client with host={self.url} and name={self.client_name}"
 
@@ -476,6 +557,7 @@ class _SuperstaQClient:
                 api_version={self.api_version!r},
                 max_retry_seconds={self.max_retry_seconds!r},
                 verbose={self.verbose!r},
+                supports_streaming={self.supports_streaming!r},
             )"""
         )
 
@@ -11,10 +11,14 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 # pylint: disable=missing-function-docstring
+import concurrent.futures
 import contextlib
+import copy
 import io
+import itertools
 import json
 import os
+import pickle
 from unittest import mock
 
 import pytest
@@ -46,6 +50,45 @@ def test_superstaq_client_str_and_repr() -> None:
     assert str(eval(repr(client))) == str(client)
 
 
+def test_superstaq_client_session() -> None:
+    client = gss.superstaq_client._SuperstaQClient(
+        client_name="general-superstaq",
+        remote_host="http://example.com",
+        api_key="to_my_heart",
+    )
+    with mock.patch("requests.adapters.HTTPAdapter") as mock_adapter:
+        assert isinstance(client.session, requests.Session)
+        mock_adapter.assert_called_once_with(pool_maxsize=client.MAX_POOL_SIZE)
+
+        for url in ("http://example.com", "https://example.com"):
+            assert client.session.get_adapter(url) is mock_adapter.return_value
+
+    # Sessions are reused within a thread, but not shared between threads
+    assert client.session is client.session
+    with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
+        thread_session = executor.submit(lambda: client.session).result()
+    assert isinstance(thread_session, requests.Session)
+    assert thread_session is not client.session
+
+
+def test_superstaq_client_pickle_and_deepcopy() -> None:
+    client = gss.superstaq_client._SuperstaQClient(
+        client_name="general-superstaq",
+        remote_host="http://example.com",
+        api_key="to_my_heart",
+        supports_streaming=True,
+    )
+    session = client.session
+
+    for client_copy in (pickle.loads(pickle.dumps(client)), copy.deepcopy(client)):
+        assert repr(client_copy) == repr(client)
+        assert client_copy.headers == client.headers
+        assert isinstance(client_copy.session, requests.Session)
+        assert client_copy.session is not session
+
+    assert client.session is session
+
+
 def test_general_superstaq_exception_str() -> None:
     ex = gss.SuperstaQException("err", status_code=501)
     assert str(ex) == "Status code: 501, Message: 'err'"
@@ -102,15 +145,17 @@ def test_superstaq_client_attributes() -> None:
         api_key="to_my_heart",
         max_retry_seconds=10,
         verbose=True,
+        supports_streaming=True,
     )
     assert client.url == f"http://example.com/{API_VERSION}"
     assert client.headers == EXPECTED_HEADERS
     assert client.max_retry_seconds == 10
     assert client.verbose
+    assert client.supports_streaming
 
 
 @mock.patch("general_superstaq.superstaq_client._SuperstaQClient._accept_terms_of_use")
-@mock.patch("requests.get")
+@mock.patch("requests.Session.get")
 def test_superstaq_client_needs_accept_terms_of_use(
     mock_get: mock.MagicMock,
     mock_accept_terms_of_use: mock.MagicMock,
@@ -145,7 +190,7 @@ def test_superstaq_client_needs_accept_terms_of_use(
         assert capsys.readouterr().out == "Accepted. You can now continue using SuperstaQ.\n"
 
 
-@mock.patch("requests.post")
+@mock.patch("requests.Session.post")
 def test_supertstaq_client_create_job(mock_post: mock.MagicMock) -> None:
     mock_post.return_value.status_code = requests.codes.ok
     mock_post.return_value.json.return_value = {"foo": "bar"}
@@ -179,7 +224,7 @@ def test_supertstaq_client_create_job(mock_post: mock.MagicMock) -> None:
     )
 
 
-@mock.patch("requests.post")
+@mock.patch("requests.Session.post")
 def test_superstaq_client_create_job_unauthorized(mock_post: mock.MagicMock) -> None:
     mock_post.return_value.ok = False
     mock_post.return_value.status_code = requests.codes.unauthorized
@@ -193,7 +238,7 @@ def test_superstaq_client_create_job_unauthorized(mock_post: mock.MagicMock) ->
         _ = client.create_job({"Hello": "World"}, target="ss_example_qpu")
 
 
-@mock.patch("requests.post")
+@mock.patch("requests.Session.post")
 def test_superstaq_client_create_job_not_found(mock_post: mock.MagicMock) -> None:
     mock_post.return_value.ok = False
     mock_post.return_value.status_code = requests.codes.not_found
@@ -207,7 +252,7 @@ def test_superstaq_client_create_job_not_found(mock_post: mock.MagicMock) -> Non
         _ = client.create_job({"Hello": "World"}, target="ss_example_qpu")
 
 
-@mock.patch("requests.post")
+@mock.patch("requests.Session.post")
 def test_superstaq_client_create_job_not_retriable(mock_post: mock.MagicMock) -> None:
     mock_post.return_value.ok = False
     mock_post.return_value.status_code = requests.codes.not_implemented
@@ -221,7 +266,7 @@ def test_superstaq_client_create_job_not_retriable(mock_post: mock.MagicMock) ->
         _ = client.create_job({"Hello": "World"}, target="ss_example_qpu")
 
 
-@mock.patch("requests.post")
+@mock.patch("requests.Session.post")
 def test_superstaq_client_create_job_retry(mock_post: mock.MagicMock) -> None:
     response1 = mock.MagicMock()
     response2 = mock.MagicMock()
@@ -242,7 +287,7 @@ def test_superstaq_client_create_job_retry(mock_post: mock.MagicMock) -> None:
     assert mock_post.call_count == 2
 
 
-@mock.patch("requests.post")
+@mock.patch("requests.Session.post")
 def test_superstaq_client_create_job_retry_request_error(mock_post: mock.MagicMock) -> None:
     response2 = mock.MagicMock()
     mock_post.side_effect = [requests.exceptions.ConnectionError(), response2]
@@ -256,7 +301,7 @@ def test_superstaq_client_create_job_retry_request_error(mock_post: mock.MagicMo
     assert mock_post.call_count == 2
 
 
-@mock.patch("requests.post")
+@mock.patch("requests.Session.post")
 def test_superstaq_client_create_job_timeout(mock_post: mock.MagicMock) -> None:
     mock_post.return_value.ok = False
     mock_post.return_value.status_code = requests.codes.service_unavailable
@@ -271,7 +316,7 @@ def test_superstaq_client_create_job_timeout(mock_post: mock.MagicMock) -> None:
         _ = client.create_job({"Hello": "World"}, target="ss_example_qpu")
 
 
-@mock.patch("requests.post")
+@mock.patch("requests.Session.post")
 def test_superstaq_client_create_job_json(mock_post: mock.MagicMock) -> None:
     mock_post.return_value.ok = False
     mock_post.return_value.status_code = requests.codes.bad_request
@@ -290,7 +335,7 @@ def test_superstaq_client_create_job_json(mock_post: mock.MagicMock) -> None:
         )
 
 
-@mock.patch("requests.get")
+@mock.patch("requests.Session.get")
 def test_superstaq_client_get_job(mock_get: mock.MagicMock) -> None:
     mock_get.return_value.ok = True
     mock_get.return_value.json.return_value = {"foo": "bar"}
@@ -307,7 +352,61 @@ def test_superstaq_client_get_job(mock_get: mock.MagicMock) -> None:
     )
 
 
-@mock.patch("requests.get")
+@mock.patch("requests.Session.get")
+def test_superstaq_client_stream_job(mock_get: mock.MagicMock) -> None:
+    mock_get.return_value.ok = True
+    mock_get.return_value.iter_lines.return_value = [
+        b'data: {"status": "Queued"}',
+        b"",
+        b": keep-alive",
+        b'data: {"status": "Done"}',
+    ]
+    client = gss.superstaq_client._SuperstaQClient(
+        client_name="general-superstaq",
+        remote_host="http://example.com",
+        api_key="to_my_heart",
+    )
+    assert not client.supports_streaming
+
+    updates = client.stream_job(job_id="job_id", timeout=10)
+    assert list(updates) == [{"status": "Queued"}, {"status": "Done"}]
+    mock_get.return_value.close.assert_called_once()
+
+    mock_get.assert_called_with(
+        f"http://example.com/{API_VERSION}/job/job_id/stream",
+        headers=EXPECTED_HEADERS,
+        verify=False,
+        stream=True,
+        timeout=10,
+    )
+
+    # Streams end at the timeout, even if the server keeps sending keep-alives
+    mock_get.reset_mock()
+    mock_get.return_value.iter_lines.return_value = itertools.repeat(b": keep-alive")
+    with mock.patch("time.time", side_effect=[0.0, 0.5, 1.0]):
+        assert list(client.stream_job(job_id="job_id", timeout=1.0)) == []
+    mock_get.return_value.close.assert_called_once()
+
+    # Dropped connections end the stream
+    mock_get.return_value.iter_lines.side_effect = requests.ConnectionError()
+    assert list(client.stream_job(job_id="job_id")) == []
+
+    # As do streams which can't be opened, without retrying
+    mock_get.reset_mock()
+    mock_get.return_value.ok = False
+    mock_get.return_value.status_code = requests.codes.not_found
+    assert list(client.stream_job(job_id="job_id")) == []
+    mock_get.assert_called_once()
+    mock_get.return_value.iter_lines.assert_not_called()
+    mock_get.return_value.close.assert_called_once()
+
+    mock_get.reset_mock()
+    mock_get.side_effect = requests.ConnectionError()
+    assert list(client.stream_job(job_id="job_id")) == []
+    mock_get.assert_called_once()
+
+
+@mock.patch("requests.Session.get")
 def test_superstaq_client_get_balance(mock_get: mock.MagicMock) -> None:
     mock_get.return_value.ok = True
     mock_get.return_value.json.return_value = {"balance": 123.4567}
@@ -324,7 +423,7 @@ def test_superstaq_client_get_balance(mock_get: mock.MagicMock) -> None:
     )
 
 
-@mock.patch("requests.get")
+@mock.patch("requests.Session.get")
 def test_superstaq_client_get_version(mock_get: mock.MagicMock) -> None:
     mock_get.return_value.ok = True
     mock_get.return_value.headers = {"superstaq_version": "1.2.3"}
@@ -339,7 +438,7 @@ def test_superstaq_client_get_version(mock_get: mock.MagicMock) -> None:
     mock_get.assert_called_with(f"http://example.com/{API_VERSION}")
 
 
-@mock.patch("requests.post")
+@mock.patch("requests.Session.post")
 def test_add_new_user(mock_post: mock.MagicMock) -> None:
     client = gss.superstaq_client._SuperstaQClient(
         client_name="general-superstaq",
@@ -358,7 +457,7 @@ def test_add_new_user(mock_post: mock.MagicMock) -> None:
     )
 
 
-@mock.patch("requests.post")
+@mock.patch("requests.Session.post")
 def test_update_user_balance(mock_post: mock.MagicMock) -> None:
     client = gss.superstaq_client._SuperstaQClient(
         client_name="general-superstaq",
@@ -377,7 +476,7 @@ def test_update_user_balance(mock_post: mock.MagicMock) -> None:
     )
 
 
-@mock.patch("requests.post")
+@mock.patch("requests.Session.post")
 def test_update_user_role(mock_post: mock.MagicMock) -> None:
     client = gss.superstaq_client._SuperstaQClient(
         client_name="general-superstaq",
@@ -396,7 +495,7 @@ def test_update_user_role(mock_post: mock.MagicMock) -> None:
     )
 
 
-@mock.patch("requests.post")
+@mock.patch("requests.Session.post")
 def test_superstaq_client_resource_estimate(mock_post: mock.MagicMock) -> None:
     client = gss.superstaq_client._SuperstaQClient(
         client_name="general-superstaq",
@@ -410,7 +509,7 @@ def test_superstaq_client_resource_estimate(mock_post: mock.MagicMock) -> None:
     assert mock_post.call_args[0][0] == f"http://example.com/{API_VERSION}/resource_estimate"
 
 
-@mock.patch("requests.get")
+@mock.patch("requests.Session.get")
 def test_superstaq_client_get_targets(mock_get: mock.MagicMock) -> None:
     mock_get.return_value.ok = True
     targets = {
@@ -454,7 +553,7 @@ def test_superstaq_client_get_targets(mock_get: mock.MagicMock) -> None:
     )
 
 
-@mock.patch("requests.get")
+@mock.patch("requests.Session.get")
 def test_superstaq_client_get_job_unauthorized(mock_get: mock.MagicMock) -> None:
     mock_get.return_value.ok = False
     mock_get.return_value.status_code = requests.codes.unauthorized
@@ -468,7 +567,7 @@ def test_superstaq_client_get_job_unauthorized(mock_get: mock.MagicMock) -> None
         _ = client.get_job("job_id")
 
 
-@mock.patch("requests.get")
+@mock.patch("requests.Session.get")
 def test_superstaq_client_get_job_not_found(mock_get: mock.MagicMock) -> None:
     (mock_get.return_value).ok = False
     (mock_get.return_value).status_code = requests.codes.not_found
@@ -482,7 +581,7 @@ def test_superstaq_client_get_job_not_found(mock_get: mock.MagicMock) -> None:
         _ = client.get_job("job_id")
 
 
-@mock.patch("requests.get")
+@mock.patch("requests.Session.get")
 def test_superstaq_client_get_job_not_retriable(mock_get: mock.MagicMock) -> None:
     mock_get.return_value.ok = False
     mock_get.return_value.status_code = requests.codes.bad_request
@@ -496,7 +595,7 @@ def test_superstaq_client_get_job_not_retriable(mock_get: mock.MagicMock) -> Non
         _ = client.get_job("job_id")
 
 
-@mock.patch("requests.get")
+@mock.patch("requests.Session.get")
 def test_superstaq_client_get_job_retry(mock_get: mock.MagicMock) -> None:
     response1 = mock.MagicMock()
     response2 = mock.MagicMock()
@@ -513,7 +612,7 @@ def test_superstaq_client_get_job_retry(mock_get: mock.MagicMock) -> None:
     assert mock_get.call_count == 2
 
 
-@mock.patch("requests.post")
+@mock.patch("requests.Session.post")
 def test_superstaq_client_aqt_compile(mock_post: mock.MagicMock) -> None:
     client = gss.superstaq_client._SuperstaQClient(
         client_name="general-superstaq",
@@ -526,7 +625,7 @@ def test_superstaq_client_aqt_compile(mock_post: mock.MagicMock) -> None:
     assert mock_post.call_args[0][0] == f"http://example.com/{API_VERSION}/aqt_compile"
 
 
-@mock.patch("requests.post")
+@mock.patch("requests.Session.post")
 def test_superstaq_client_qscout_compile(mock_post: mock.MagicMock) -> None:
     client = gss.superstaq_client._SuperstaQClient(
         client_name="general-superstaq",
@@ -539,7 +638,7 @@ def test_superstaq_client_qscout_compile(mock_post: mock.MagicMock) -> None:
     assert mock_post.call_args[0][0] == f"http://example.com/{API_VERSION}/qscout_compile"
 
 
-@mock.patch("requests.post")
+@mock.patch("requests.Session.post")
 def test_superstaq_client_compile(mock_post: mock.MagicMock) -> None:
     client = gss.superstaq_client._SuperstaQClient(
         client_name="general-superstaq",
@@ -554,7 +653,7 @@ def test_superstaq_client_compile(mock_post: mock.MagicMock) -> None:
     assert mock_post.call_args[0][0] == f"http://example.com/{API_VERSION}/compile"
 
 
-@mock.patch("requests.post")
+@mock.patch("requests.Session.post")
 def test_superstaq_client_submit_qubo(mock_post: mock.MagicMock) -> None:
     client = gss.superstaq_client._SuperstaQClient(
         client_name="general-superstaq",
@@ -586,7 +685,7 @@ def test_superstaq_client_submit_qubo(mock_post: mock.MagicMock) -> None:
     )
 
 
-@mock.patch("requests.post")
+@mock.patch("requests.Session.post")
 def test_superstaq_client_supercheq(mock_post: mock.MagicMock) -> None:
     client = gss.superstaq_client._SuperstaQClient(
         client_name="general-superstaq",
@@ -609,7 +708,7 @@ def test_superstaq_client_supercheq(mock_post: mock.MagicMock) -> None:
     )
 
 
-@mock.patch("requests.post")
+@mock.patch("requests.Session.post")
 def test_superstaq_client_find_min_vol_portfolio(mock_post: mock.MagicMock) -> None:
     client = gss.superstaq_client._SuperstaQClient(
         client_name="general-superstaq",
@@ -629,7 +728,7 @@ def test_superstaq_client_find_min_vol_portfolio(mock_post: mock.MagicMock) -> N
     )
 
 
-@mock.patch("requests.post")
+@mock.patch("requests.Session.post")
 def test_superstaq_client_find_max_pseudo_sharpe_ratio(mock_post: mock.MagicMock) -> None:
     client = gss.superstaq_client._SuperstaQClient(
         client_name="general-superstaq",
@@ -647,7 +746,7 @@ def test_superstaq_client_find_max_pseudo_sharpe_ratio(mock_post: mock.MagicMock
     )
 
 
-@mock.patch("requests.post")
+@mock.patch("requests.Session.post")
 def test_superstaq_client_tsp(mock_post: mock.MagicMock) -> None:
     client = gss.superstaq_client._SuperstaQClient(
         client_name="general-superstaq",
@@ -665,7 +764,7 @@ def test_superstaq_client_tsp(mock_post: mock.MagicMock) -> None:
     )
 
 
-@mock.patch("requests.post")
+@mock.patch("requests.Session.post")
 def test_superstaq_client_warehouse(mock_post: mock.MagicMock) -> None:
     client = gss.superstaq_client._SuperstaQClient(
         client_name="general-superstaq",
@@ -693,7 +792,7 @@ def test_superstaq_client_warehouse(mock_post: mock.MagicMock) -> None:
     )
 
 
-@mock.patch("requests.post")
+@mock.patch("requests.Session.post")
 def test_superstaq_client_ibmq_set_token(mock_post: mock.MagicMock) -> None:
     client = gss.superstaq_client._SuperstaQClient(
         client_name="general-superstaq",
@@ -712,7 +811,7 @@ def test_superstaq_client_ibmq_set_token(mock_post: mock.MagicMock) -> None:
     )
 
 
-@mock.patch("requests.post")
+@mock.patch("requests.Session.post")
 def test_superstaq_client_cq_set_token(mock_post: mock.MagicMock) -> None:
     client = gss.superstaq_client._SuperstaQClient(
         client_name="general-superstaq",
@@ -731,7 +830,7 @@ def test_superstaq_client_cq_set_token(mock_post: mock.MagicMock) -> None:
     )
 
 
-@mock.patch("requests.post")
+@mock.patch("requests.Session.post")
 def test_superstaq_client_aqt_upload_configs(mock_post: mock.MagicMock) -> None:
     client = gss.superstaq_client._SuperstaQClient(
         client_name="general-superstaq",
@@ -750,7 +849,7 @@ def test_superstaq_client_aqt_upload_configs(mock_post: mock.MagicMock) -> None:
     )
 
 
-@mock.patch("requests.get")
+@mock.patch("requests.Session.get")
 def test_superstaq_client_aqt_get_configs(mock_get: mock.MagicMock) -> None:
     expected_json = {"pulses": "Hello", "variables": "World"}
 
@@ -764,7 +863,7 @@ def test_superstaq_client_aqt_get_configs(mock_get: mock.MagicMock) -> None:
     assert client.aqt_get_configs() == expected_json
 
 
-@mock.patch("requests.post")
+@mock.patch("requests.Session.post")
 def test_superstaq_client_target_info(mock_post: mock.MagicMock) -> None:
     client = gss.superstaq_client._SuperstaQClient(
         client_name="general-superstaq",
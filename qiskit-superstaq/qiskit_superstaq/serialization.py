@@ -2,7 +2,7 @@ import io
 import json
 import re
 import warnings
-from typing import Dict, List, Set, Tuple, TypeVar, Union
+from typing import Any, Dict, List, Set, Tuple, TypeVar, Union
 
 import general_superstaq as gss
 import numpy as np
@@ -13,22 +13,31 @@ from qiskit.converters.ast_to_dag import AstInterpreter
 
 import qiskit_superstaq as qss
 
+try:
+    import orjson
+except ModuleNotFoundError:
+    orjson = None  # type: ignore[assignment]
+
 T = TypeVar("T")
 RealArray = Union[int, float, List["RealArray"]]
 
 
-def json_encoder(val: object) -> Dict[str, Union[str, RealArray]]:
-    """Convert (real or complex) arrays to a JSON-serializable format.
+def json_encoder(val: object) -> object:
+    """Convert (real or complex) arrays and numpy scalars to a JSON-serializable format.
 
     Args:
         val: The value to be serialized.
 
     Returns:
-        A JSON dictionary containing the provided name and array values.
+        A JSON dictionary containing the provided name and array values, or the equivalent python
+        scalar if `val` is a numpy scalar.
 
     Raises:
-        TypeError: If `val` is not a `np.ndarray`.
+        TypeError: If `val` is not a `np.ndarray` or numpy scalar.
     """
+    if isinstance(val, np.generic):
+        return val.item()
+
     if isinstance(val, np.ndarray):
         return {
             "type": "qss_array",
@@ -57,7 +66,7 @@ def json_resolver(val: T) -> Union[T, npt.NDArray[np.complex_]]:
 
 
 def to_json(val: object) -> str:
-    """Extends `json.dumps` to support numpy arrays.
+    """Extends `json.dumps` to support numpy arrays and scalars.
 
     Args:
         val: The value to be serialized.
@@ -68,6 +77,27 @@ def to_json(val: object) -> str:
     return json.dumps(val, default=json_encoder)
 
 
+def from_json(json_str: Union[str, bytes]) -> Any:
+    """Equivalent to `json.loads`, but uses `orjson` if it is installed.
+
+    Input which `orjson` rejects but `json.loads` accepts (e.g. `NaN` or `Infinity`) is parsed with
+    `json.loads`. Note that `orjson` parses integers which don't fit in 64 bits as floats.
+
+    Args:
+        json_str: The JSON string to be deserialized.
+
+    Returns:
+        The deserialized value.
+    """
+    if orjson is not None:
+        try:
+            return orjson.loads(json_str)
+        except orjson.JSONDecodeError:
+            pass
+
+    return json.loads(json_str)
+
+
 def _assign_unique_inst_names(circuit: qiskit.QuantumCircuit) -> qiskit.QuantumCircuit:
     """QPY requires unique custom gates to have unique `.name` attributes (including parameterized
     gates differing by just their `.params` attributes). This function rewrites the input circuit
@@ -1,4 +1,5 @@
 # pylint: disable=missing-function-docstring
+import importlib
 import io
 import json
 import warnings
@@ -49,6 +50,39 @@ def test_to_json() -> None:
         qss.serialization.to_json(qiskit.QuantumCircuit())
 
 
+def test_to_json_numpy_scalars() -> None:
+    val = {"atol": np.float64(1e-2), "seed": np.int64(1234), "flag": np.bool_(True)}
+    json_str = qss.serialization.to_json(val)
+    assert json_str == json.dumps({"atol": 1e-2, "seed": 1234, "flag": True})
+    assert isinstance(json.loads(json_str)["seed"], int)
+
+    special_val = {1: float("nan"), 2: 2**70}
+    assert qss.serialization.to_json(special_val) == '{"1": NaN, "2": 1180591620717411303424}'
+
+
+def test_from_json() -> None:
+    assert qss.serialization.from_json("[[[0, 4], [1, 5]]]") == [[[0, 4], [1, 5]]]
+    assert qss.serialization.from_json(qss.serialization.to_json({1: 2})) == {"1": 2}
+
+    val = qss.serialization.from_json(qss.serialization.to_json([float("nan"), float("inf")]))
+    assert np.isnan(val[0]) and val[1] == float("inf")
+
+    with pytest.raises(ValueError):
+        _ = qss.serialization.from_json("[1, 2")
+
+
+def test_from_json_without_orjson() -> None:
+    try:
+        with mock.patch.dict("sys.modules", {"orjson": None}):
+            importlib.reload(qss.serialization)
+            assert qss.serialization.orjson is None
+
+            json_str = qss.serialization.to_json({"abc": [1, 2.5], 3: np.array([1j])})
+            assert qss.serialization.from_json(json_str) == json.loads(json_str)
+    finally:
+        importlib.reload(qss.serialization)
+
+
 def test_assign_unique_inst_names() -> None:
     inst_0 = qss.ZZSwapGate(0.1)
     inst_1 = qss.ZZSwapGate(0.2)
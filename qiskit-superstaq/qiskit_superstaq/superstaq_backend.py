@@ -13,16 +13,37 @@
 # that they have been altered from the originals.
 from __future__ import annotations
 
-import json
-from typing import Any, Dict, List, Mapping, Optional, Union
+import re
+from typing import TYPE_CHECKING, Any, Dict, List, Mapping, Optional, Tuple, Union
 
 import general_superstaq as gss
-import numpy as np
-import numpy.typing as npt
 import qiskit
 
 import qiskit_superstaq as qss
 
+if TYPE_CHECKING:
+    # only needed for annotations (numpy is still imported at runtime by qiskit)
+    import numpy as np
+    import numpy.typing as npt
+
+# matches the prefixes of targets with dedicated compile methods
+_TARGET_PREFIX_RE = re.compile(r"^(ibmq|aqt|sandia|cq)_")
+
+# entangling gates supported by `SuperstaQBackend.qscout_compile()`
+_VALID_ENTANGLING = frozenset({"xx", "zz"})
+
+
+def _has_measurement(circuit: qiskit.QuantumCircuit) -> bool:
+    """Checks whether the input circuit contains any measurements, stopping at the first one.
+
+    Args:
+        circuit: The qiskit circuit to check.
+
+    Returns:
+        True if `circuit` contains a measurement, False otherwise.
+    """
+    return any(instruction.operation.name == "measure" for instruction in circuit.data)
+
 
 def _get_metadata_of_circuits(
     circuits: Union[qiskit.QuantumCircuit, List[qiskit.QuantumCircuit]]
@@ -36,17 +57,60 @@ def _get_metadata_of_circuits(
         A list of dictionaries containing the metadata of the input circuit(s). If a circuit has no
         metadata, an empty dictionary is stored for that circuit.
     """
-    metadata_of_circuits = [
-        (circuit.metadata or {})
-        for circuit in (circuits if isinstance(circuits, list) else [circuits])
-    ]
+    circuits_seq = circuits if isinstance(circuits, list) else (circuits,)
+
+    # preallocate the output list, to avoid resizing it for large batches of circuits
+    metadata_of_circuits: List[Dict[Any, Any]] = [{}] * len(circuits_seq)
+    for i, circuit in enumerate(circuits_seq):
+        metadata_of_circuits[i] = circuit.metadata or {}
 
     return metadata_of_circuits
 
 
+def _serialize_with_metadata(
+    circuits: Union[qiskit.QuantumCircuit, List[qiskit.QuantumCircuit]]
+) -> Tuple[str, List[Dict[Any, Any]], bool]:
+    """Serializes the input qiskit circuit(s) and extracts their metadata.
+
+    Args:
+        circuits: The circuit(s) to serialize.
+
+    Returns:
+        A tuple containing the serialized circuit(s), a list of dictionaries containing the metadata
+        of the input circuit(s), and whether `circuits` was a list of circuits (as opposed to a
+        single circuit).
+    """
+    circuits_is_list = not isinstance(circuits, qiskit.QuantumCircuit)
+    circuits_seq = list(circuits) if circuits_is_list else [circuits]
+    serialized_circuits = qss.serialization.serialize_circuits(circuits_seq)
+    return serialized_circuits, _get_metadata_of_circuits(circuits_seq), circuits_is_list
+
+
 class SuperstaQBackend(qiskit.providers.BackendV1):
     """This class represents a Superstaq backend."""
 
+    # compile methods for each of the target prefixes matched by `_TARGET_PREFIX_RE`
+    _PREFIX_DISPATCH = {
+        "ibmq": "ibmq_compile",
+        "aqt": "aqt_compile",
+        "sandia": "qscout_compile",
+        "cq": "cq_compile",
+    }
+
+    # configuration shared by all Superstaq backends (besides "backend_name" and "gates")
+    _CONFIGURATION_TEMPLATE: Dict[str, Any] = {
+        "backend_version": "n/a",
+        "n_qubits": -1,
+        "basis_gates": None,
+        "local": False,
+        "simulator": False,
+        "conditional": False,
+        "open_pulse": False,
+        "memory": False,
+        "max_shots": -1,
+        "coupling_map": None,
+    }
+
     def __init__(self, provider: qss.SuperstaQProvider, target: str) -> None:
         """Initializes a SuperstaQBackend.
 
@@ -55,19 +119,11 @@ class SuperstaQBackend(qiskit.providers.BackendV1):
             target: A string containing the name of a target backend.
         """
         self._provider = provider
+        self._target_info: Optional[Dict[str, Any]] = None
         self.configuration_dict = {
             "backend_name": target,
-            "backend_version": "n/a",
-            "n_qubits": -1,
-            "basis_gates": None,
-            "gates": [],
-            "local": False,
-            "simulator": False,
-            "conditional": False,
-            "open_pulse": False,
-            "memory": False,
-            "max_shots": -1,
-            "coupling_map": None,
+            **self._CONFIGURATION_TEMPLATE,
+            "gates": [],  # (a new list for each backend, as it is mutable)
         }
 
         qss.validation.validate_target(target)
@@ -79,6 +135,16 @@ class SuperstaQBackend(qiskit.providers.BackendV1):
             provider=provider,
         )
 
+    def _target_prefix(self) -> Optional[str]:
+        """Gets the prefix of this backend's target, if it has a dedicated compile method.
+
+        Returns:
+            The target prefix (e.g. "aqt" for "aqt_keysight_qpu"), or None if this backend's target
+            has no dedicated compile method.
+        """
+        match = _TARGET_PREFIX_RE.match(self.name())
+        return match.group(1) if match else None
+
     @classmethod
     def _default_options(cls) -> qiskit.providers.Options:
         return qiskit.providers.Options(shots=1000)
@@ -118,7 +184,7 @@ class SuperstaQBackend(qiskit.providers.BackendV1):
             circuits = [circuits]
 
         qss.validation.validate_qiskit_circuits(circuits)
-        if not all(circuit.count_ops().get("measure") for circuit in circuits):
+        if not all(map(_has_measurement, circuits)):
             # TODO: only raise if the run method actually requires samples (and not for e.g. a
             # statevector simulation)
             raise ValueError("Circuit has no measurements to sample.")
@@ -159,34 +225,21 @@ class SuperstaQBackend(qiskit.providers.BackendV1):
             ValueError: If this backend does not support compilation.
         """
         qss.validation.validate_qiskit_circuits(circuits)
-        if self.name().startswith("ibmq_"):
-            return self.ibmq_compile(circuits, **kwargs)
+        prefix = self._target_prefix()
+        if prefix is not None:
+            return getattr(self, self._PREFIX_DISPATCH[prefix])(circuits, **kwargs)
 
-        elif self.name().startswith("aqt_"):
-            return self.aqt_compile(circuits, **kwargs)
-
-        elif self.name().startswith("sandia_"):
-            return self.qscout_compile(circuits, **kwargs)
-
-        elif self.name().startswith("cq_"):
-            return self.cq_compile(circuits, **kwargs)
-
-        qss.validation.validate_target(self.name())
-        metadata_of_circuits = _get_metadata_of_circuits(circuits)
-        circuits_is_list = not isinstance(circuits, qiskit.QuantumCircuit)
-        request_json = self._get_compile_request_json(circuits, **kwargs)
+        serialized_circuits, metadata_of_circuits, circuits_is_list = _serialize_with_metadata(
+            circuits
+        )
+        request_json = self._get_compile_request_json(serialized_circuits, **kwargs)
         json_dict = self._provider._client.compile(request_json)
         return qss.compiler_output.read_json_only_circuits(
             json_dict, metadata_of_circuits, circuits_is_list
         )
 
-    def _get_compile_request_json(
-        self,
-        circuits: Union[qiskit.QuantumCircuit, List[qiskit.QuantumCircuit]],
-        **kwargs: Any,
-    ) -> Dict[str, str]:
+    def _get_compile_request_json(self, serialized_circuits: str, **kwargs: Any) -> Dict[str, str]:
         """"""
-        serialized_circuits = qss.serialization.serialize_circuits(circuits)
         return {
             "qiskit_circuits": serialized_circuits,
             "target": self.name(),
@@ -232,7 +285,7 @@ class SuperstaQBackend(qiskit.providers.BackendV1):
         Raises:
             ValueError: If this is not an AQT backend.
         """
-        if not self.name().startswith("aqt_"):
+        if self._target_prefix() != "aqt":
             raise ValueError(f"{self.name()} is not a valid AQT target.")
 
         options: Dict[str, Any] = {**kwargs}
@@ -245,9 +298,10 @@ class SuperstaQBackend(qiskit.providers.BackendV1):
         if gate_defs is not None:
             options["gate_defs"] = gate_defs
 
-        metadata_of_circuits = _get_metadata_of_circuits(circuits)
-        circuits_is_list = not isinstance(circuits, qiskit.QuantumCircuit)
-        request_json = self._get_compile_request_json(circuits, **options)
+        serialized_circuits, metadata_of_circuits, circuits_is_list = _serialize_with_metadata(
+            circuits
+        )
+        request_json = self._get_compile_request_json(serialized_circuits, **options)
         json_dict = self._provider._client.aqt_compile(request_json)
         return qss.compiler_output.read_json_aqt(
             json_dict, metadata_of_circuits, circuits_is_list, num_equivalent_circuits
@@ -271,22 +325,24 @@ class SuperstaQBackend(qiskit.providers.BackendV1):
         Raises:
             ValueError: If this is not an IBMQ backend.
         """
-        if not self.name().startswith("ibmq_"):
+        if self._target_prefix() != "ibmq":
             raise ValueError(f"{self.name()} is not a valid IBMQ target.")
 
-        request_json = self._get_compile_request_json(circuits, **kwargs)
+        serialized_circuits, metadata_of_circuits, circuits_is_list = _serialize_with_metadata(
+            circuits
+        )
+        request_json = self._get_compile_request_json(serialized_circuits, **kwargs)
         json_dict = self._provider._client.compile(request_json)
         compiled_circuits = qss.serialization.deserialize_circuits(json_dict["qiskit_circuits"])
-        metadata_of_circuits = _get_metadata_of_circuits(circuits)
         for circuit, metadata in zip(compiled_circuits, metadata_of_circuits):
             circuit.metadata = metadata
         pulses = None
         if "pulses" in json_dict:
             pulses = gss.serialization.deserialize(json_dict["pulses"])
         final_logical_to_physicals: List[Dict[int, int]] = list(
-            map(dict, json.loads(json_dict["final_logical_to_physicals"]))
+            map(dict, qss.serialization.from_json(json_dict["final_logical_to_physicals"]))
         )
-        if isinstance(circuits, qiskit.QuantumCircuit):
+        if not circuits_is_list:
             pulse_sequence = None if pulses is None else pulses[0]
             return qss.compiler_output.CompilerOutput(
                 compiled_circuits[0], final_logical_to_physicals[0], pulse_sequences=pulse_sequence
@@ -333,22 +389,22 @@ class SuperstaQBackend(qiskit.providers.BackendV1):
             ValueError: If this is not a Sandia backend.
             ValueError: If `base_entangling_gate` is not a valid entangling basis.
         """
-        if not self.name().startswith("sandia_"):
+        if self._target_prefix() != "sandia":
             raise ValueError(f"{self.name()} is not a valid Sandia target.")
 
-        if base_entangling_gate not in ("xx", "zz"):
+        if base_entangling_gate not in _VALID_ENTANGLING:
             raise ValueError("base_entangling_gate must be either 'xx' or 'zz'")
 
-        qss.validation.validate_target(self.name())
-        metadata_of_circuits = _get_metadata_of_circuits(circuits)
-        circuits_is_list = not isinstance(circuits, qiskit.QuantumCircuit)
+        serialized_circuits, metadata_of_circuits, circuits_is_list = _serialize_with_metadata(
+            circuits
+        )
 
         options = {
             **kwargs,
             "mirror_swaps": mirror_swaps,
             "base_entangling_gate": base_entangling_gate,
         }
-        request_json = self._get_compile_request_json(circuits, **options)
+        request_json = self._get_compile_request_json(serialized_circuits, **options)
         json_dict = self._provider._client.qscout_compile(request_json)
         return qss.compiler_output.read_json_qscout(
             json_dict, metadata_of_circuits, circuits_is_list
@@ -371,13 +427,13 @@ class SuperstaQBackend(qiskit.providers.BackendV1):
         Raises:
             ValueError: If this is not a CQ backend.
         """
-        if not self.name().startswith("cq_"):
+        if self._target_prefix() != "cq":
             raise ValueError(f"{self.name()} is not a valid CQ target.")
 
-        qss.validation.validate_target(self.name())
-        metadata_of_circuits = _get_metadata_of_circuits(circuits)
-        circuits_is_list = not isinstance(circuits, qiskit.QuantumCircuit)
-        request_json = self._get_compile_request_json(circuits, **kwargs)
+        serialized_circuits, metadata_of_circuits, circuits_is_list = _serialize_with_metadata(
+            circuits
+        )
+        request_json = self._get_compile_request_json(serialized_circuits, **kwargs)
         json_dict = self._provider._client.compile(request_json)
         return qss.compiler_output.read_json_only_circuits(
             json_dict, metadata_of_circuits, circuits_is_list
@@ -386,7 +442,18 @@ class SuperstaQBackend(qiskit.providers.BackendV1):
     def target_info(self) -> Dict[str, Any]:
         """Returns information about this backend.
 
+        The information is only requested from Superstaq the first time this method is called, and
+        reused afterwards (until `invalidate_target_info()` is called).
+
         Returns:
-            A dictionary of target information.
+            A dictionary of target information. This is a (shallow) copy of the stored information,
+            so adding or replacing its entries doesn't affect later calls.
         """
-        return self._provider._client.target_info(self.name())["target_info"]
+        if self._target_info is None:
+            self._target_info = self._provider._client.target_info(self.name())["target_info"]
+        return dict(self._target_info)
+
+    def invalidate_target_info(self) -> None:
+        """Clears the stored target information, so that the next call to `target_info()` requests
+        it from Superstaq again."""
+        self._target_info = None
@@ -1,5 +1,7 @@
 # pylint: disable=missing-function-docstring,missing-class-docstring
+import copy
 import json
+import pickle
 import textwrap
 from unittest.mock import DEFAULT, MagicMock, patch
 
@@ -10,6 +12,18 @@ import qiskit
 import qiskit_superstaq as qss
 
 
+def test_pickle_and_deepcopy() -> None:
+    provider = qss.SuperstaQProvider(api_key="MY_TOKEN")
+    backend = qss.SuperstaQBackend(provider=provider, target="ibmq_qasm_simulator")
+    session = provider._client.session
+
+    for backend_copy in (pickle.loads(pickle.dumps(backend)), copy.deepcopy(backend)):
+        assert backend_copy.name() == backend.name()
+        assert backend_copy.configuration_dict == backend.configuration_dict
+        assert repr(backend_copy._provider._client) == repr(provider._client)
+        assert backend_copy._provider._client.session is not session
+
+
 def test_default_options() -> None:
     provider = qss.SuperstaQProvider(api_key="MY_TOKEN")
     backend = qss.SuperstaQBackend(provider=provider, target="ibmq_qasm_simulator")
@@ -89,7 +103,7 @@ def test_eq() -> None:
     assert backend1 == backend3
 
 
-@patch("requests.post")
+@patch("requests.Session.post")
 def test_aqt_compile(mock_post: MagicMock) -> None:
     # AQT compile
     provider = qss.SuperstaQProvider(api_key="MY_TOKEN")
@@ -181,7 +195,7 @@ def test_aqt_compile(mock_post: MagicMock) -> None:
     assert not hasattr(out, "circuit") and not hasattr(out, "pulse_list")
 
 
-@patch("requests.post")
+@patch("requests.Session.post")
 def test_ibmq_compile(mock_post: MagicMock) -> None:
     provider = qss.SuperstaQProvider(api_key="MY_TOKEN")
     backend = provider.get_backend("ibmq_jakarta_qpu")
@@ -206,7 +220,7 @@ def test_ibmq_compile(mock_post: MagicMock) -> None:
         backend.aqt_compile([qc])
 
 
-@patch("requests.post")
+@patch("requests.Session.post")
 def test_qscout_compile(mock_post: MagicMock) -> None:
     provider = qss.SuperstaQProvider(api_key="MY_TOKEN")
     backend = provider.get_backend("sandia_qscout_qpu")
@@ -247,7 +261,7 @@ def test_qscout_compile(mock_post: MagicMock) -> None:
     assert out.final_logical_to_physicals == [{0: 13}, {0: 13}]
 
 
-@patch("requests.post")
+@patch("requests.Session.post")
 def test_compile(mock_post: MagicMock) -> None:
     # Compilation to a simulator (e.g., AWS)
     provider = qss.SuperstaQProvider(api_key="MY_TOKEN")
@@ -271,5 +285,15 @@ def test_target_info() -> None:
     with patch(
         "general_superstaq.superstaq_client._SuperstaQClient.target_info",
         return_value=fake_data,
-    ):
+    ) as mock_target_info:
+        assert backend.target_info() == fake_data["target_info"]
+        assert backend.target_info() == fake_data["target_info"]
+        mock_target_info.assert_called_once_with(target)
+
+        # Modifying the returned dictionary doesn't affect the stored target information
+        backend.target_info()["backend_name"] = "modified"
+        assert backend.target_info() == fake_data["target_info"]
+
+        backend.invalidate_target_info()
         assert backend.target_info() == fake_data["target_info"]
+        assert mock_target_info.call_count == 2
@@ -12,8 +12,10 @@
 # copyright notice, and modified files need to carry a notice indicating
 # that they have been altered from the originals.
 
+import concurrent.futures
+import threading
 import time
-from typing import Any, Dict, List, Optional
+from typing import Any, ClassVar, Dict, FrozenSet, List, Optional, Tuple
 
 import qiskit
 
@@ -28,9 +30,20 @@ class SuperstaQJob(qiskit.providers.JobV1):
         job_id: String containing the unique job ID from Superstaq.
     """
 
+    # states of a Superstaq API job from which it cannot transition
+    TERMINAL_STATES: ClassVar[FrozenSet[str]] = frozenset({"Done", "Canceled", "Error"})
+
+    # maximum number of (sub-)jobs to request from Superstaq at once
+    MAX_CONCURRENT_REQUESTS = 8
+
+    # thread pool shared by all jobs for concurrent requests (created on first use)
+    _executor: ClassVar[Optional[concurrent.futures.ThreadPoolExecutor]] = None
+    _executor_lock: ClassVar[threading.Lock] = threading.Lock()
+
     def __init__(self, backend: qss.SuperstaQBackend, job_id: str) -> None:
 
         super().__init__(backend, job_id)
+        self._job_ids: Tuple[str, ...] = tuple(job_id.split(","))  # separate aggregated job_ids
 
     def __eq__(self, other: Any) -> bool:
 
@@ -39,43 +52,87 @@ class SuperstaQJob(qiskit.providers.JobV1):
 
         return self._job_id == other._job_id
 
-    def _wait_for_results(
-        self, timeout: Optional[float] = None, wait: float = 5
-    ) -> List[Dict[str, Dict[str, int]]]:
+    def _stream_result(
+        self, job_id: str, start_time: float, timeout: Optional[float] = None
+    ) -> Optional[Dict[str, Any]]:
+        """Waits for a single (sub-)job to finish by streaming its updates from Superstaq.
+
+        Args:
+            job_id: The id of the (sub-)job to wait for.
+            start_time: The time at which we started waiting for this job.
+            timeout: An optional number of seconds after `start_time` at which to stop waiting.
 
-        result_list: List[Dict[str, Dict[str, int]]] = []
-        job_ids = self._job_id.split(",")  # separate aggregated job_ids
+        Returns:
+            The final result of the job, or None if the stream closed (or couldn't be opened) before
+            the job finished.
+
+        Raises:
+            JobTimeoutError: If the job did not finish within `timeout` seconds.
+        """
+        remaining_time = None
+        if timeout:
+            remaining_time = timeout - (time.time() - start_time)
+            if remaining_time <= 0:
+                return None
+
+        client = self._backend._provider._client
+        for result in client.stream_job(job_id, timeout=remaining_time):
+            if result["status"] in self.TERMINAL_STATES:
+                return result
+            if timeout and time.time() - start_time >= timeout:
+                raise qiskit.providers.JobTimeoutError("Timed out waiting for result")
+        return None
 
-        for jid in job_ids:
+    def _wait_for_results(
+        self, timeout: Optional[float] = None, wait: float = 0.5, max_poll_interval: float = 5
+    ) -> List[Dict[str, Any]]:
+
+        client = self._backend._provider._client
+        result_list: List[Dict[str, Any]] = []
+        for jid in self._job_ids:
             start_time = time.time()
-            while True:
+            poll_interval = wait
+            result: Optional[Dict[str, Any]] = None
+            if client.supports_streaming:
+                # if the stream closes before the job is finished, fall back to polling below
+                result = self._stream_result(jid, start_time, timeout)
+
+            while result is None:
                 elapsed = time.time() - start_time
 
                 if timeout and elapsed >= timeout:
                     raise qiskit.providers.JobTimeoutError("Timed out waiting for result")
 
-                result = self._backend._provider._client.get_job(jid)
-                if result["status"] == "Done":
-                    break
-                if result["status"] == "Error":
-                    raise qiskit.providers.JobError("API returned error:\n" + str(result))
-                time.sleep(wait)
+                polled_result = client.get_job(jid)
+                if polled_result["status"] in self.TERMINAL_STATES:
+                    result = polled_result
+                else:
+                    time.sleep(poll_interval)
+                    poll_interval = min(poll_interval * 2, max_poll_interval)  # exponential backoff
+
+            if result["status"] != "Done":
+                raise qiskit.providers.JobError("API returned error:\n" + str(result))
             result_list.append(result)
         return result_list
 
-    def result(self, timeout: Optional[float] = None, wait: float = 5) -> qiskit.result.Result:
+    def result(
+        self, timeout: Optional[float] = None, wait: float = 0.5, max_poll_interval: float = 5
+    ) -> qiskit.result.Result:
         """Retrieves the result data associated with a Superstaq job.
 
         Args:
             timeout: An optional parameter that fixes when result retrieval times out. Units are
                 in seconds.
-            wait: An optional parameter that sets the interval to check for Superstaq job results.
+            wait: An optional parameter that sets the initial interval to check for Superstaq job
+                results. The interval doubles after every check, up to `max_poll_interval`. Units
+                are in seconds.
+            max_poll_interval: The maximum interval between checks for Superstaq job results.
                 Units are in seconds.
 
         Returns:
             A qiskit result object containing job information.
         """
-        results = self._wait_for_results(timeout, wait)
+        results = self._wait_for_results(timeout, wait, max_poll_interval)
 
         # create list of result dictionaries
         results_list = []
@@ -102,6 +159,36 @@ class SuperstaQJob(qiskit.providers.JobV1):
             }
         )
 
+    @classmethod
+    def _get_executor(cls) -> concurrent.futures.ThreadPoolExecutor:
+        """Gets the thread pool used to request aggregated jobs concurrently, creating it if needed.
+
+        The pool is shared by all jobs, so its worker threads (and the per-thread client sessions
+        they hold) are reused across `status()` calls.
+
+        Returns:
+            The shared `concurrent.futures.ThreadPoolExecutor`.
+        """
+        with cls._executor_lock:
+            if cls._executor is None:
+                cls._executor = concurrent.futures.ThreadPoolExecutor(
+                    max_workers=cls.MAX_CONCURRENT_REQUESTS, thread_name_prefix="superstaq_job"
+                )
+            return cls._executor
+
+    def _get_jobs(self) -> List[Dict[str, Any]]:
+        """Gets the current state of every (sub-)job in this job from Superstaq, fetching aggregated
+        jobs concurrently.
+
+        Returns:
+            A list containing the job dictionary of each (sub-)job, in order.
+        """
+        client = self._backend._provider._client
+        if len(self._job_ids) == 1:
+            return [client.get_job(self._job_ids[0])]
+
+        return list(self._get_executor().map(client.get_job, self._job_ids))
+
     def status(self) -> qiskit.providers.jobstatus.JobStatus:
         """Checks Superstaq job status.
 
@@ -109,15 +196,12 @@ class SuperstaQJob(qiskit.providers.JobV1):
             The job status.
         """
 
-        job_id_list = self._job_id.split(",")  # separate aggregated job ids
-
         status = "Done"
 
         # when we have multiple jobs, we will take the "worst status" among the jobs
         # For example, if any of the jobs are still queued, we report Queued as the status
         # for the entire batch.
-        for job_id in job_id_list:
-            result = self._backend._provider._client.get_job(job_id)
+        for result in self._get_jobs():
             temp_status = result["status"]
 
             if temp_status == "Queued":
@@ -1,4 +1,5 @@
 # pylint: disable=missing-function-docstring,missing-class-docstring
+import itertools
 from typing import Dict, Union
 from unittest import mock
 
@@ -22,6 +23,8 @@ def backend() -> qss.SuperstaQBackend:
 def test_wait_for_results(backend: qss.SuperstaQBackend) -> None:
     job = qss.SuperstaQJob(backend=backend, job_id="123abc")
     jobs = qss.SuperstaQJob(backend=backend, job_id="123abc,456def")
+    assert job._job_ids == ("123abc",)
+    assert jobs._job_ids == ("123abc", "456def")
 
     with mock.patch(
         "general_superstaq.superstaq_client._SuperstaQClient.get_job",
@@ -37,6 +40,13 @@ def test_wait_for_results(backend: qss.SuperstaQBackend) -> None:
         with pytest.raises(qiskit.providers.JobError, match="API returned error"):
             _ = job._wait_for_results()
 
+    with mock.patch(
+        "general_superstaq.superstaq_client._SuperstaQClient.get_job",
+        return_value=mock_response("Canceled"),
+    ):
+        with pytest.raises(qiskit.providers.JobError, match="API returned error"):
+            _ = job._wait_for_results()
+
 
 def test_timeout(backend: qss.SuperstaQBackend) -> None:
     job = qss.SuperstaQJob(backend=backend, job_id="123abc")
@@ -52,6 +62,105 @@ def test_timeout(backend: qss.SuperstaQBackend) -> None:
         assert mocked_get_job.call_count == 3
 
 
+def test_wait_for_results_backoff(backend: qss.SuperstaQBackend) -> None:
+    job = qss.SuperstaQJob(backend=backend, job_id="123abc")
+
+    responses = 8 * [mock_response("Queued")] + [mock_response("Done")]
+    with mock.patch(
+        "general_superstaq.superstaq_client._SuperstaQClient.get_job", side_effect=responses
+    ) as mocked_get_job, mock.patch("time.sleep") as mocked_sleep:
+        assert job._wait_for_results() == [mock_response("Done")]
+        assert mocked_get_job.call_count == 9
+        assert [call[0][0] for call in mocked_sleep.call_args_list] == [
+            0.5,
+            1.0,
+            2.0,
+            4.0,
+            5,
+            5,
+            5,
+            5,
+        ]
+
+    responses = 3 * [mock_response("Queued")] + [mock_response("Done")]
+    with mock.patch(
+        "general_superstaq.superstaq_client._SuperstaQClient.get_job", side_effect=responses
+    ), mock.patch("time.sleep") as mocked_sleep:
+        assert job._wait_for_results(wait=1.0, max_poll_interval=1.5) == [mock_response("Done")]
+        assert [call[0][0] for call in mocked_sleep.call_args_list] == [1.0, 1.5, 1.5]
+
+    # The poll interval is reset for each (sub-)job of an aggregated job
+    job = qss.SuperstaQJob(backend=backend, job_id="123abc,456def")
+    responses = 3 * [mock_response("Queued")] + [mock_response("Done")]
+    with mock.patch(
+        "general_superstaq.superstaq_client._SuperstaQClient.get_job", side_effect=2 * responses
+    ), mock.patch("time.sleep") as mocked_sleep:
+        assert job._wait_for_results() == 2 * [mock_response("Done")]
+        assert [call[0][0] for call in mocked_sleep.call_args_list] == 2 * [0.5, 1.0, 2.0]
+
+
+def test_wait_for_results_streaming() -> None:
+    provider = qss.SuperstaQProvider(api_key="token", supports_streaming=True)
+    backend = provider.get_backend("ss_example_qpu")
+    job = qss.SuperstaQJob(backend=backend, job_id="123abc")
+
+    with mock.patch(
+        "general_superstaq.superstaq_client._SuperstaQClient.stream_job",
+        return_value=iter([mock_response("Queued"), mock_response("Done")]),
+    ) as mocked_stream_job, mock.patch(
+        "general_superstaq.superstaq_client._SuperstaQClient.get_job"
+    ) as mocked_get_job:
+        assert job._wait_for_results(timeout=10) == [mock_response("Done")]
+        mocked_stream_job.assert_called_once()
+        assert mocked_stream_job.call_args[0] == ("123abc",)
+        assert 0 < mocked_stream_job.call_args[1]["timeout"] <= 10
+        mocked_get_job.assert_not_called()
+
+    # Fall back to polling if the stream closes early
+    with mock.patch(
+        "general_superstaq.superstaq_client._SuperstaQClient.stream_job",
+        return_value=iter([mock_response("Running")]),
+    ), mock.patch(
+        "general_superstaq.superstaq_client._SuperstaQClient.get_job",
+        return_value=mock_response("Done"),
+    ) as mocked_get_job:
+        assert job._wait_for_results() == [mock_response("Done")]
+        mocked_get_job.assert_called_once_with("123abc")
+
+    with mock.patch(
+        "general_superstaq.superstaq_client._SuperstaQClient.stream_job",
+        return_value=iter([mock_response("Queued"), mock_response("Error")]),
+    ):
+        with pytest.raises(qiskit.providers.JobError, match="API returned error"):
+            _ = job._wait_for_results()
+
+    # Time out while streaming
+    with mock.patch(
+        "general_superstaq.superstaq_client._SuperstaQClient.stream_job",
+        return_value=iter([mock_response("Queued"), mock_response("Done")]),
+    ), mock.patch("time.time", side_effect=[0.0, 1.0, 3.0]):
+        with pytest.raises(qiskit.providers.JobTimeoutError, match="Timed out"):
+            _ = job._wait_for_results(timeout=2.0)
+
+    # Time out while the server only sends keep-alives
+    with mock.patch("requests.Session.get") as mock_get, mock.patch(
+        "general_superstaq.superstaq_client._SuperstaQClient.get_job"
+    ) as mocked_get_job, mock.patch("time.time", side_effect=itertools.count(0.0, 0.5)):
+        mock_get.return_value.ok = True
+        mock_get.return_value.iter_lines.return_value = itertools.repeat(b": keep-alive")
+        with pytest.raises(qiskit.providers.JobTimeoutError, match="Timed out"):
+            _ = job._wait_for_results(timeout=1.0)
+        mocked_get_job.assert_not_called()
+
+    # Don't open a stream if there's no time left
+    with mock.patch(
+        "general_superstaq.superstaq_client._SuperstaQClient.stream_job"
+    ) as mocked_stream_job:
+        with pytest.raises(qiskit.providers.JobTimeoutError, match="Timed out"):
+            _ = job._wait_for_results(timeout=-1.0)
+        mocked_stream_job.assert_not_called()
+
+
 def test_result(backend: qss.SuperstaQBackend) -> None:
     job = qss.SuperstaQJob(backend=backend, job_id="123abc")
 
@@ -100,6 +209,35 @@ def test_status(backend: qss.SuperstaQBackend) -> None:
         assert job.status() == qiskit.providers.JobStatus.DONE
 
 
+def test_multi_job_status(backend: qss.SuperstaQBackend) -> None:
+    job = qss.SuperstaQJob(backend=backend, job_id="123abc,456def,789ghi")
+
+    statuses = {"123abc": "Done", "456def": "Running", "789ghi": "Done"}
+    with mock.patch(
+        "general_superstaq.superstaq_client._SuperstaQClient.get_job",
+        side_effect=lambda job_id: mock_response(statuses[job_id]),
+    ) as mocked_get_job:
+        assert job.status() == qiskit.providers.JobStatus.RUNNING
+        assert sorted(call[0][0] for call in mocked_get_job.call_args_list) == sorted(statuses)
+
+    statuses["789ghi"] = "Queued"
+    with mock.patch(
+        "general_superstaq.superstaq_client._SuperstaQClient.get_job",
+        side_effect=lambda job_id: mock_response(statuses[job_id]),
+    ):
+        assert job.status() == qiskit.providers.JobStatus.QUEUED
+
+    statuses["456def"] = statuses["789ghi"] = "Done"
+    with mock.patch(
+        "general_superstaq.superstaq_client._SuperstaQClient.get_job",
+        side_effect=lambda job_id: mock_response(statuses[job_id]),
+    ):
+        assert job.status() == qiskit.providers.JobStatus.DONE
+
+    # The same thread pool is reused across calls (and jobs)
+    assert qss.SuperstaQJob._get_executor() is qss.SuperstaQJob._get_executor()
+
+
 def test_submit(backend: qss.SuperstaQBackend) -> None:
     job = qss.SuperstaQJob(backend=backend, job_id="12345")
     with pytest.raises(NotImplementedError, match="Submit through SuperstaQBackend"):
@@ -49,6 +49,7 @@ class SuperstaQProvider(
         api_version: str = gss.API_VERSION,
         max_retry_seconds: int = 3600,
         verbose: bool = False,
+        supports_streaming: bool = False,
     ) -> None:
         """Initializes a SuperstaQProvider.
 
@@ -72,6 +73,8 @@ class SuperstaQProvider(
             api_version: The version of the API.
             max_retry_seconds: The number of seconds to retry calls for. Defaults to one hour.
             verbose: Whether to print to stdio and stderr on retriable errors.
+            supports_streaming: Whether to wait for job results over a streaming connection (if the
+                Superstaq server supports it) instead of polling.
 
         Raises:
             EnvironmentError: If an API key was not provided and could not be found.
@@ -85,6 +88,7 @@ class SuperstaQProvider(
             api_version=api_version,
             max_retry_seconds=max_retry_seconds,
             verbose=verbose,
+            supports_streaming=supports_streaming,
         )
 
     def __str__(self) -> str:
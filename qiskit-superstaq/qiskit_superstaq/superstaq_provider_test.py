@@ -29,6 +29,10 @@ def test_provider() -> None:
 
     assert repr(ss_provider) == "<SuperstaQProvider(api_key=MY_TOKEN, name=superstaq_provider)>"
 
+    assert not ss_provider._client.supports_streaming
+    streaming_provider = qss.SuperstaQProvider(api_key="MY_TOKEN", supports_streaming=True)
+    assert streaming_provider._client.supports_streaming
+
     targets = {
         "superstaq_targets": {
             "compile-and-run": [
@@ -75,7 +79,7 @@ def test_get_balance() -> None:
     assert ss_provider.get_balance(pretty_output=False) == 12345.6789
 
 
-@patch("requests.post")
+@patch("requests.Session.post")
 def test_aqt_compile(mock_post: MagicMock) -> None:
     provider = qss.SuperstaQProvider(api_key="MY_TOKEN")
 
@@ -116,7 +120,7 @@ def test_invalid_target_aqt_compile() -> None:
         provider.aqt_compile(qiskit.QuantumCircuit(), target="invalid_target")
 
 
-@patch("requests.post")
+@patch("requests.Session.post")
 def test_aqt_compile_eca(mock_post: MagicMock) -> None:
     provider = qss.superstaq_provider.SuperstaQProvider(api_key="MY_TOKEN")
 
@@ -146,7 +150,7 @@ def test_invalid_target_aqt_compile_eca() -> None:
         )
 
 
-@patch("requests.post")
+@patch("requests.Session.post")
 def test_ibmq_compile(mock_post: MagicMock) -> None:
     provider = qss.SuperstaQProvider(api_key="MY_TOKEN")
     qc = qiskit.QuantumCircuit(8)
@@ -225,7 +229,7 @@ def test_resource_estimate_list(mock_resource_estimate: MagicMock) -> None:
     )
 
 
-@patch("requests.post")
+@patch("requests.Session.post")
 def test_qscout_compile(mock_post: MagicMock) -> None:
     provider = qss.SuperstaQProvider(api_key="MY_TOKEN")
 
@@ -272,7 +276,7 @@ def test_invalid_target_qscout_compile() -> None:
         provider.qscout_compile(qiskit.QuantumCircuit(), target="invalid_target")
 
 
-@patch("requests.post")
+@patch("requests.Session.post")
 @pytest.mark.parametrize("mirror_swaps", (True, False))
 def test_qscout_compile_swap_mirror(mock_post: MagicMock, mirror_swaps: bool) -> None:
     provider = qss.SuperstaQProvider(api_key="MY_TOKEN")
@@ -293,7 +297,7 @@ def test_qscout_compile_swap_mirror(mock_post: MagicMock, mirror_swaps: bool) ->
     }
 
 
-@patch("requests.post")
+@patch("requests.Session.post")
 @pytest.mark.parametrize("base_entangling_gate", ("xx", "zz"))
 def test_qscout_compile_change_entangler(mock_post: MagicMock, base_entangling_gate: str) -> None:
     provider = qss.SuperstaQProvider(api_key="MY_TOKEN")
@@ -314,7 +318,7 @@ def test_qscout_compile_change_entangler(mock_post: MagicMock, base_entangling_g
     }
 
 
-@patch("requests.post")
+@patch("requests.Session.post")
 def test_qscout_compile_wrong_entangler(mock_post: MagicMock) -> None:
     provider = qss.SuperstaQProvider(api_key="MY_TOKEN")
 
@@ -324,7 +328,7 @@ def test_qscout_compile_wrong_entangler(mock_post: MagicMock) -> None:
         _ = provider.qscout_compile(qc, base_entangling_gate="yy")
 
 
-@patch("requests.post")
+@patch("requests.Session.post")
 def test_cq_compile(mock_post: MagicMock) -> None:
     provider = qss.SuperstaQProvider(api_key="MY_TOKEN")
 
@@ -373,7 +377,7 @@ def test_supercheq(mock_supercheq: mock.MagicMock) -> None:
     assert provider.supercheq([[0]], 1, 1) == (circuits, fidelities)
 
 
-@patch("requests.post")
+@patch("requests.Session.post")
 def test_target_info(mock_post: MagicMock) -> None:
     provider = qss.SuperstaQProvider(api_key="key")
     fake_data = {"target_info": {"backend_name": "test_fake_device", "max_experiments": 1234}}